@@ -14,46 +14,198 @@ Requires holdings.csv, a csv file of 'symbol', 'url'
 Outputs prices.csv, as csv file of 'Holding' (='symbol'), 'GBP Price'
 """
 
+import argparse
 import csv
-from typing import no_type_check
-import pandas as pd
+import dbm
+import fcntl
+import math
+import os
+import queue
+import re
+import shelve
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Final, Iterator, no_type_check
+from urllib.parse import urlparse
+import lxml.etree
+import lxml.html
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (JavascriptException, TimeoutException,
+                                        WebDriverException)
 
+# Number of concurrent WebDriver instances used to look up prices
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+# Upper limit in seconds for loading a webpage
+PAGE_LOAD_TIMEOUT = 10
+# Upper limit in seconds for the price element to appear on a loaded webpage
+ELEMENT_WAIT_TIMEOUT = 5
+# Upper limit in seconds for fetching a webpage without a browser
+REQUEST_TIMEOUT = 10
 
-class GBPPrice(float):
-    """ Unit price of a holding in GBP """
-    def __new__(cls, value: float | str, currency: str = 'GBP'):
-        value = float(value)
-        if currency == 'GBP':
-            pass
-        elif currency == 'GBX':
-            value *= 0.01
-        else:
-            raise NotImplementedError(f"Currency {currency} not supported")
-        return float.__new__(cls, value)
+# File for caching looked up prices between runs, and their lifetime in seconds
+CACHE_FILE = '.pricecache.db'
+# Lock file serialising access to CACHE_FILE between processes
+CACHE_LOCK_FILE = CACHE_FILE + '.lock'
+CACHE_TTL = 5 * 60
+# Persistent Chromium profiles, one per concurrent web driver (across all
+# processes), so the browser cache is reused between runs, and the browser
+# cache size limit in bytes
+PROFILES_DIR = os.path.expanduser('~/.cache/pricecheck-chromium')
+BROWSER_CACHE_SIZE = 100 * 1024 * 1024
+
+# XPaths locating the price (and its currency) on each supported webpage
+_IWEB_PRICE_XPATH: Final[str] = (
+    "//p[contains(@class, 'description__label') "
+    "and contains(text(), 'Price')]/following-sibling::*[1]")
+_LSE_PRICE_XPATH: Final[str] = '//span[@class="price-tag"]'
+_LSE_CURRENCY_XPATH: Final[str] = '//div[contains(@class, "currency-label")]'
+
+# XPaths compiled once for parsing static webpages with lxml
+_IWEB_PRICE_XPATH_LXML: Final = lxml.etree.XPath(_IWEB_PRICE_XPATH)
+_LSE_PRICE_XPATH_LXML: Final = lxml.etree.XPath(_LSE_PRICE_XPATH)
+_LSE_CURRENCY_XPATH_LXML: Final = lxml.etree.XPath(_LSE_CURRENCY_XPATH)
+
+# Resources not needed to read prices, blocked from loading in the browser
+_BLOCKED_URLS: Final[list[str]] = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.woff*',
+    '*googletagmanager*', '*doubleclick*', '*google-analytics*']
+
+# Returns the text of the first node matching each XPath argument (or null),
+# so several elements can be read in a single WebDriver round-trip
+_XPATH_TEXTS_SCRIPT: Final[str] = """
+return Array.from(arguments, xpath => {
+    const node = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    return node ? node.innerText : null;
+});
+"""
+
+# Shared HTTP session so connections are kept alive between requests
+_session = requests.Session()
+_session.headers['User-Agent'] = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36')
+
+
+# First number in a price, allowing thousands separators e.g. '£1,234.56'
+_NUMERIC: Final = re.compile(r'[-+]?\d[\d,]*(?:\.\d+)?')
+
+# Conversion factors from supported currencies to GBP
+_CCY: Final[dict[str, float]] = {'GBP': 1.0, 'GBX': 0.01}
+
+
+def to_gbp(value: float | str, currency: str = 'GBP') -> float:
+    """ Convert unit price of a holding in currency to GBP """
+    try:
+        factor = _CCY[currency]
+    except KeyError:
+        raise NotImplementedError(
+            f"Currency {currency} not supported") from None
+    return float(value) * factor
 
-    def __str__(self, format_spec: str = ".4g"):
-        return f"£{self:{format_spec}}"
+
+def parse_gbp(text: str, currency: str = 'GBP') -> float | None:
+    """ Convert the price displayed in text in currency to GBP
+        Returns None if text does not contain a number
+    """
+    match = _NUMERIC.search(text)
+    if match is None:
+        return None
+    return to_gbp(match.group().replace(',', ''), currency)
+
+
+def format_gbp(value: float | None, format_spec: str = ".4g") -> str:
+    """ Format a GBP price for display """
+    if value is None:
+        return "n/a"
+    return f"£{value:{format_spec}}"
 
 
 @no_type_check
-def setup_chromium_driver() -> WebDriver:
-    """ Instantiate Selenium Chromium Webdriver """
+def setup_chromium_driver(user_data_dir: str) -> WebDriver:
+    """ Instantiate Selenium Chromium Webdriver
+        user_data_dir: profile directory, which must not be in use by another
+                       running browser
+    """
     options = webdriver.ChromeOptions()
     options.add_argument("--disable-extensions")
+    options.add_argument(f"--user-data-dir={user_data_dir}")
     options.add_argument("--profile-directory=Default")
-    options.add_argument("--incognito")
+    options.add_argument(f"--disk-cache-size={BROWSER_CACHE_SIZE}")
     options.add_argument("--disable-plugins-discovery")
+    # Run without a window or GPU process as nothing is interactive
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1280,800")
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2})
+    # Return from driver.get() at DOMContentLoaded rather than waiting for
+    # every image, advert and third-party script to load
+    options.page_load_strategy = 'eager'
+
+    service = Service('/snap/bin/chromium.chromedriver')
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    # Elements are awaited explicitly with WebDriverWait, so never poll
+    # implicitly in find_element
+    driver.implicitly_wait(0)
 
-    driver = webdriver.Chrome(service=Service('/snap/bin/chromium.chromedriver',
-                                              options=options))
+    # Block images, fonts, adverts and trackers at the network layer
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
     return driver
 
 
+def quit_driver(driver: WebDriver) -> None:
+    """ Shut down web driver, ignoring errors from an already dead session """
+    try:
+        driver.quit()
+    except WebDriverException as e:
+        print(f"Error shutting down web driver: {e}")
+
+
+def session_alive(driver: WebDriver) -> bool:
+    """ Check whether the web driver session still responds to commands """
+    try:
+        _ = driver.current_window_handle
+    except WebDriverException:
+        return False
+    return True
+
+
+def lock_profile() -> tuple[str, int]:
+    """ Find a Chromium profile directory in PROFILES_DIR not in use by any
+        web driver, in this or another process, and lock it for exclusive use
+        Returns the profile directory and the file descriptor holding its lock,
+        which must be closed once the web driver using it has shut down
+    """
+    os.makedirs(PROFILES_DIR, exist_ok=True)
+    profile = 0
+    while True:
+        fd = os.open(os.path.join(PROFILES_DIR, f'{profile}.lock'),
+                     os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # Profile in use, so try the next one
+            os.close(fd)
+            profile += 1
+            continue
+        return os.path.join(PROFILES_DIR, str(profile)), fd
+
+
 def read_holdings(filename: str) -> list[list[str]]:
     """ Read holdings list and associated URLs for price lookup """
     with open(filename, 'r', encoding='UTF-8') as file:
@@ -62,76 +214,406 @@ def read_holdings(filename: str) -> list[list[str]]:
         if header != ['symbol', 'url']:
             raise ValueError('Holdings file must only have columns symbol,url')
 
-        # Return list of [symbol, url]
-        return [row for row in reader]
+        # Return list of [symbol, url], skipping blank lines
+        return [row for row in reader if row]
+
+
+def fetch_static(url: str) -> lxml.html.HtmlElement:
+    """ Fetch a webpage without a browser and parse it into an HTML tree """
+    response = _session.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return lxml.html.fromstring(response.content)
+
+
+def parse_price_from_iweb(tree: lxml.html.HtmlElement) -> float | None:
+    """ Extracts current market price from static iweb webpage
+        tree: HTML tree of the webpage from fetch_static(url)
+        Returns None if the price is not present, e.g. rendered by JavaScript
+    """
+    elements = _IWEB_PRICE_XPATH_LXML(tree)
+    if not elements:
+        return None
+
+    return parse_gbp(elements[0].text_content(), 'GBX')
+
+
+def parse_price_from_lse(tree: lxml.html.HtmlElement) -> float | None:
+    """ Extracts current market price from static LSE webpage
+        tree: HTML tree of the webpage from fetch_static(url)
+        Returns None if the price is not present, e.g. rendered by JavaScript
+    """
+    clbls = _LSE_CURRENCY_XPATH_LXML(tree)
+    elements = _LSE_PRICE_XPATH_LXML(tree)
+    if not clbls or not elements:
+        return None
+
+    currency = clbls[0].text_content().strip()[-5:].strip('()')
+    return parse_gbp(elements[0].text_content(), currency)
 
 
-def get_price_from_iweb(driver: WebDriver) -> GBPPrice | None:
+def xpath_texts_present(
+        *xpaths: str) -> Callable[[WebDriver], list[str] | bool]:
+    """ WebDriverWait condition returning the texts of the first elements
+        matching each of xpaths once all are present, using a single
+        WebDriver round-trip per poll
+    """
+    def _predicate(driver: WebDriver) -> list[str] | bool:
+        texts = driver.execute_script(_XPATH_TEXTS_SCRIPT, *xpaths)
+        return False if None in texts else texts
+
+    return _predicate
+
+
+def get_price_from_iweb(driver: WebDriver) -> float | None:
     """ Extracts current market price from iweb webpage
         driver: WebDriver object pre-loaded with a webpage using driver.get(url)
     """
     try:
-        element = driver.find_element(
-            By.XPATH, "//p[contains(@class, 'description__label') "
-                      "and contains(text(), 'Price')]/following-sibling::*")
-    except (NoSuchElementException, TimeoutException) as e:
+        element = WebDriverWait(driver, ELEMENT_WAIT_TIMEOUT).until(
+            EC.presence_of_element_located((By.XPATH, _IWEB_PRICE_XPATH)))
+    except TimeoutException as e:
         print(f"Error getting price: {e}")
         return None
 
-    val = GBPPrice(element.text.replace(',', '')[:8], 'GBX')
+    val = parse_gbp(element.text, 'GBX')
+    if val is None:
+        print(f"Error getting price: no number in {element.text!r}")
     return val
 
 
-def get_price_from_lse(driver: WebDriver) -> GBPPrice | None:
+def get_price_from_lse(driver: WebDriver) -> float | None:
     """ Extracts current market price from LSE webpage
         driver: WebDriver object pre-loaded with a webpage using driver.get(url)
     """
-    # Get the currency label to convert from GBX if required
+    # Read the price with the currency label, to convert from GBX if required.
+    # Retry script errors, e.g. while the page is still loading.
     try:
-        clbl = driver.find_element(
-            By.XPATH, '//div[contains(@class, "currency-label")]')
-        currency = clbl.text[-5:].strip('()')
-
-        element = driver.find_element(By.XPATH, '//span[@class="price-tag"]')
-    except (NoSuchElementException, TimeoutException) as e:
+        clbl, text = WebDriverWait(
+            driver, ELEMENT_WAIT_TIMEOUT,
+            ignored_exceptions=(JavascriptException,)).until(
+                xpath_texts_present(_LSE_CURRENCY_XPATH, _LSE_PRICE_XPATH))
+    except TimeoutException as e:
         print(f"Error getting price: {e}")
         return None
+    currency = clbl.strip()[-5:].strip('()')
 
-    val = GBPPrice(element.text.replace(',', '')[:8], currency)
+    val = parse_gbp(text, currency)
+    if val is None:
+        print(f"Error getting price: no number in {text!r}")
     return val
 
 
-def main(driver: WebDriver) -> None:
-    """ Main function """
-    holdings = read_holdings('holdings.csv')
+# Price extractors for each supported website, keyed by url_site(url)
+_STATIC_PARSERS: Final[dict[str, Callable[[lxml.html.HtmlElement],
+                                          float | None]]] = {
+    'lon': parse_price_from_lse,
+    'mar': parse_price_from_iweb,
+}
+_SCRAPERS: Final[dict[str, Callable[[WebDriver], float | None]]] = {
+    'lon': get_price_from_lse,
+    'mar': get_price_from_iweb,
+}
 
-    # Loop over holdings and build list list of prices
-    prices: list[tuple[str, GBPPrice | None]] = []
-    for symbol, url in holdings:
-        print(f'Looking up {symbol}')
+
+def url_site(url: str) -> str:
+    """ Identify the website of url, e.g. 'lon' for www.londonstockexchange.com
+        Raises NotImplementedError for websites without a price extractor
+    """
+    hostname = urlparse(url).hostname or ''
+    labels = hostname.split('.')
+    site = labels[1][:3] if len(labels) > 1 else ''
+    if site not in _SCRAPERS:
+        raise NotImplementedError("URL not supported")
+    return site
+
+
+def lookup_static_price(url: str) -> float | None:
+    """ Fetch url without a browser and extract the price using the matching
+        parser. Returns None if the price could not be found this way.
+    """
+    # Use url to determine how to process webpage
+    parser = _STATIC_PARSERS[url_site(url)]
+
+    try:
+        tree = fetch_static(url)
+    except (requests.RequestException, lxml.etree.ParserError) as e:
+        # e.g. connection failure, or an empty document
+        print(f"Error fetching {url}: {e}")
+        return None
+    return parser(tree)
+
+
+def lookup_price(driver: WebDriver, url: str) -> float | None:
+    """ Load url in driver and extract the price using the matching scraper """
+    # Use url to determine how to process webpage
+    scraper = _SCRAPERS[url_site(url)]
+
+    try:
         driver.get(url)
-        driver.implicitly_wait(2)
+    except TimeoutException:
+        # The DOM may still hold the price, so try to extract it regardless
+        print(f"Timed out loading {url}")
+
+    return scraper(driver)
+
+
+class DriverPoolClosed(RuntimeError):
+    """ Raised when taking a web driver from a pool that has been shut down """
+
+
+class DriverPool:
+    """ Web drivers kept running for reuse between lookups """
+    def __init__(self) -> None:
+        self._idle: queue.SimpleQueue[WebDriver] = queue.SimpleQueue()
+        # Running web drivers and the lock file descriptor of their profiles
+        self._drivers: dict[WebDriver, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self) -> WebDriver:
+        """ Take an idle web driver, starting a new one if none are idle
+            Raises DriverPoolClosed if the pool has been shut down by quit_all
+        """
+        with self._lock:
+            if self._closed:
+                raise DriverPoolClosed("Web driver pool has been shut down")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        # Use a profile not used by any running web driver
+        profile_dir, lock_fd = lock_profile()
+        try:
+            driver = setup_chromium_driver(profile_dir)
+        except BaseException:
+            os.close(lock_fd)
+            raise
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._drivers[driver] = lock_fd
+        if closed:
+            # Pool was shut down while this web driver was starting
+            quit_driver(driver)
+            os.close(lock_fd)
+            raise DriverPoolClosed("Web driver pool has been shut down")
+        return driver
+
+    @property
+    def closed(self) -> bool:
+        """ Whether the pool has been shut down by quit_all """
+        return self._closed
+
+    def release(self, driver: WebDriver) -> None:
+        """ Return a web driver to the pool for reuse
+            Does nothing once the pool is shut down, as quit_all has already
+            shut down the web driver
+        """
+        with self._lock:
+            if not self._closed:
+                self._idle.put(driver)
+
+    def discard(self, driver: WebDriver) -> None:
+        """ Shut down a broken web driver rather than returning it """
+        with self._lock:
+            lock_fd = self._drivers.pop(driver, None)
+        # Web driver has already been shut down if quit_all removed it
+        if lock_fd is not None:
+            quit_driver(driver)
+            os.close(lock_fd)
+
+    def quit_all(self) -> None:
+        """ Shut down all web drivers, including any still in use, and stop
+            further web drivers being started
+        """
+        with self._lock:
+            self._closed = True
+            drivers, self._drivers = self._drivers, {}
+        for driver, lock_fd in drivers.items():
+            quit_driver(driver)
+            os.close(lock_fd)
+
+
+def price_worker(work: queue.Queue[tuple[str, str]],
+                 prices: dict[str, float | None],
+                 lock: threading.Lock,
+                 pool: DriverPool) -> None:
+    """ Consume (symbol, url) items from work, storing the price of each url
+        in prices. Pages are fetched without a browser where possible,
+        falling back to a web driver taken from pool on first use.
+        Stops once pool is shut down, e.g. on SIGTERM.
+    """
+    driver: WebDriver | None = None
+    try:
+        while not pool.closed:
+            try:
+                symbol, url = work.get_nowait()
+            except queue.Empty:
+                return
+            print(f'Looking up {symbol}')
+            val = lookup_static_price(url)
+            if val is None:
+                # Price is rendered by JavaScript, so load page in a browser
+                try:
+                    if driver is None:
+                        driver = pool.acquire()
+                    val = lookup_price(driver, url)
+                    # Don't carry one site's cookies into the next request
+                    driver.delete_all_cookies()
+                except DriverPoolClosed:
+                    return
+                except WebDriverException as e:
+                    print(f"Web driver error looking up {symbol}: {e}")
+                    val = None
+                    # Only discard a dead session, starting afresh if needed
+                    # on the next lookup
+                    if driver is not None and not session_alive(driver):
+                        pool.discard(driver)
+                        driver = None
+            with lock:
+                prices[url] = val
+    finally:
+        # Keep web driver running for the next lookups
+        if driver is not None:
+            pool.release(driver)
+
+
+@contextmanager
+def open_cache() -> Iterator[shelve.Shelf]:
+    """ Open the price cache, locked against use by other processes until
+        closed. Keep it open only briefly, as other runs wait for the lock.
+    """
+    with open(CACHE_LOCK_FILE, 'a', encoding='UTF-8') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        with shelve.open(CACHE_FILE) as cache:
+            yield cache
+
 
-        # Use url to determine how to process webpage
-        if url[12:15] == 'lon':
-            val = get_price_from_lse(driver)
-        elif url[12:15] == 'mar':
-            val = get_price_from_iweb(driver)
+def read_cache(urls: list[str], max_age: float) -> dict[str, float]:
+    """ Read cached prices of urls looked up less than max_age seconds ago
+        Returns dict of url: price for the urls with a cached price
+    """
+    prices: dict[str, float] = {}
+    try:
+        with open_cache() as cache:
+            now = time.time()
+            for url in urls:
+                cached = cache.get(url)
+                if cached is not None and now - cached[0] < max_age:
+                    prices[url] = cached[1]
+    except dbm.error as e:
+        # Unreadable cache, so look up every price again
+        print(f"Error reading price cache: {e}")
+    return prices
+
+
+def write_cache(prices: dict[str, float | None]) -> None:
+    """ Cache prices of each url, skipping failed lookups so that they are
+        retried next run
+    """
+    now = time.time()
+    try:
+        with open_cache() as cache:
+            for url, val in prices.items():
+                if val is not None:
+                    cache[url] = (now, val)
+    except dbm.error as e:
+        print(f"Error writing price cache: {e}")
+
+
+def scrape_all(holdings: list[list[str]], pool: DriverPool,
+               max_age: float = CACHE_TTL) -> list[tuple[str, float | None]]:
+    """ Look up the GBP price of each [symbol, url] in holdings, reusing
+        cached prices looked up less than max_age seconds ago
+        Returns list of (symbol, price) in holdings order, with None where
+        lookup failed
+    """
+    # Look up each url once, even if it is shared by several symbols
+    unique_holdings: dict[str, str] = {}
+    for symbol, url in holdings:
+        unique_holdings.setdefault(url, symbol)
+
+    # Reuse recently cached prices, queueing the rest for lookup
+    url_prices: dict[str, float | None] = {}
+    url_prices.update(read_cache(list(unique_holdings), max_age))
+    work: queue.Queue[tuple[str, str]] = queue.Queue()
+    for url, symbol in unique_holdings.items():
+        if url in url_prices:
+            print(f'Using cached price for {symbol}')
         else:
-            raise NotImplementedError("URL not supported")
-        prices.append((symbol, val))
+            work.put((symbol, url))
 
-    # Convert to DataFrame and save as csv
-    df = pd.DataFrame(prices, columns=('Holding', 'GBP Price'))
-    df.to_csv('prices.csv')
-    print(df)
+    # Look up prices in parallel, each worker using its own web driver.
+    # Don't start more workers than there are pages to load.
+    n_workers = max(1, min(MAX_WORKERS, work.qsize()))
+    fetched: dict[str, float | None] = {}
+    lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [executor.submit(price_worker, work, fetched, lock, pool)
+                   for _ in range(n_workers)]
+    for future in futures:
+        future.result()
 
+    write_cache(fetched)
+    url_prices.update(fetched)
 
-if __name__ == "__main__":
-    # Start web driver
-    chromium_driver = setup_chromium_driver()
+    return [(symbol, url_prices[url]) for symbol, url in holdings]
+
+
+def write_csv(prices: list[tuple[str, float | None]], filename: str) -> None:
+    """ Save prices of each holding as csv, leaving missing prices empty """
+    with open(filename, 'w', newline='', encoding='UTF-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(('Holding', 'GBP Price'))
+        writer.writerows(prices)
+
+
+def positive_float(value: str) -> float:
+    """ argparse type accepting only finite numbers greater than zero """
     try:
-        main(chromium_driver)
+        number = float(value)
+    except ValueError:
+        number = math.nan
+    if not 0 < number < math.inf:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a positive number")
+    return number
+
+
+def main() -> None:
+    """ Main function """
+    parser = argparse.ArgumentParser(
+        description='Fetch the current price of each holding in holdings.csv '
+                    'and save them to prices.csv')
+    parser.add_argument('--interval', type=positive_float, metavar='SECONDS',
+                        help='keep running, looking up prices every SECONDS '
+                             'with web drivers kept running in between')
+    args = parser.parse_args()
+
+    # Exit cleanly on SIGTERM so web drivers are shut down
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    # Don't let cached prices outlive an interval, or repeated lookups would
+    # just return the previous results
+    max_age = CACHE_TTL
+    if args.interval is not None:
+        max_age = min(CACHE_TTL, args.interval)
+
+    pool = DriverPool()
+    try:
+        while True:
+            prices = scrape_all(read_holdings('holdings.csv'), pool, max_age)
+            write_csv(prices, 'prices.csv')
+            for symbol, val in prices:
+                print(f'{symbol}: {format_gbp(val)}')
+
+            if args.interval is None:
+                break
+            time.sleep(args.interval)
     finally:
-        # Shut down web driver
-        chromium_driver.quit()
+        # Shut down web drivers
+        pool.quit_all()
+
+
+if __name__ == "__main__":
+    main()